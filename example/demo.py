@@ -97,7 +97,7 @@ def test_commands():
 
     message = arctic_spa_client.fetch_one(MessageType.LIVE)
 
-    print(message)
+    print(message.to_debug_string())
 
     arctic_spa_client.disconnect()
 
@@ -107,7 +107,15 @@ def main():
 
     print('getting messages...')
 
-    message = arctic_spa_client.fetch_one(MessageType.LIVE)
+    messages = arctic_spa_client.poll_messages({
+        MessageType.LIVE,
+        MessageType.ONZEN_LIVE,
+        MessageType.CONFIGURATION,
+        MessageType.INFORMATION,
+        MessageType.SETTINGS
+    })
+
+    message = messages[MessageType.LIVE].data
 
     print()
     print('Live')
@@ -136,7 +144,7 @@ def main():
     print('fogger -', message.fogger)
     print()
 
-    message = arctic_spa_client.fetch_one(MessageType.ONZEN_LIVE)
+    message = messages[MessageType.ONZEN_LIVE].data
 
     print()
     print('OnzenLive')
@@ -164,7 +172,7 @@ def main():
     print('electrode_wear -', message.electrode_wear)
     print()
 
-    message = arctic_spa_client.fetch_one(MessageType.CONFIGURATION)
+    message = messages[MessageType.CONFIGURATION].data
 
     print()
     print('Configuration')
@@ -192,7 +200,7 @@ def main():
     print('yess -', message.yess)
     print()
 
-    message = arctic_spa_client.fetch_one(MessageType.INFORMATION)
+    message = messages[MessageType.INFORMATION].data
 
     print()
     print('Information')
@@ -221,7 +229,7 @@ def main():
     print('rfid_serial_number -', message.rfid_serial_number)
     print()
 
-    message = arctic_spa_client.fetch_one(MessageType.SETTINGS)
+    message = messages[MessageType.SETTINGS].data
 
     print()
     print('Settings')
@@ -29,6 +29,14 @@ from arctic_spa_dc.proto import MobileWifiDetails_pb2
 from arctic_spa_dc.proto import Lpc_pb2
 
 
+# preamble, checksum, counter, optional, message type, payload length
+_HEADER_STRUCT = struct.Struct('!I4sIIHH')
+
+HEADER_SIZE = _HEADER_STRUCT.size
+PREAMBLE = b'\xab\xad\x1d\x3a'
+_PREAMBLE_INT = int.from_bytes(PREAMBLE, 'big')
+
+
 class MessageType(IntEnum):
     LIVE = 0
     COMMAND = 1
@@ -76,8 +84,12 @@ class MessageType(IntEnum):
 class Message:
     """
     Wrapper for a protobuf message
+
+    The decoded protobuf fields are accessed through `.data`, e.g. `message.data.temperature_fahrenheit`
     """
 
+    __slots__ = ('decoder', 'message_type', 'counter', 'checksum', 'payload', 'data')
+
     MESSAGE_TYPE_DECODERS = {
         MessageType.LIVE: Live_pb2.Live,
         MessageType.COMMAND: Command_pb2.Command,
@@ -111,7 +123,7 @@ class Message:
         MessageType.lpc_power: Lpc_pb2.lpc_power
     }
 
-    def __init__(self, message_type: MessageType, counter: int, checksum: bytes, payload: bytes):
+    def __init__(self, message_type: MessageType, counter: int, checksum: bytes, payload: bytes | memoryview):
         self.decoder = self.MESSAGE_TYPE_DECODERS.get(message_type)
 
         if not self.decoder:
@@ -120,29 +132,63 @@ class Message:
         self.message_type = message_type
         self.counter = counter
         self.checksum = checksum
-        self.payload = payload
-        self.data = self._decode(payload)
+        self.payload = bytes(payload)
+        self.data = self._decode()
+
+    @classmethod
+    def from_payload(
+        cls,
+        message_type: MessageType,
+        counter: int,
+        checksum: bytes,
+        payload: bytes | memoryview,
+        decoder: type,
+        data=None
+    ) -> 'Message':
+        """
+        Creates a message using a decoder the caller has already looked up, skipping the check in `__init__`
+
+        If `data` is given, that protobuf instance is cleared and reused instead of allocating a new one
+        """
+        message = cls.__new__(cls)
+        message.decoder = decoder
+        message.message_type = message_type
+        message.counter = counter
+        message.checksum = checksum
+        message.payload = bytes(payload)  # Own a copy; views may be into a reused read buffer
+        message.data = message._decode(data)
+        return message
 
-    def _decode(self, payload: bytes):
-        data = self.decoder()
-        data.ParseFromString(payload)
+    def _decode(self, data=None):
+        if data is None:
+            data = self.decoder()
+        data.ParseFromString(self.payload)  # Clears any previous contents
         return data
 
     def _checksum_str(self) -> str:
-        return ''.join(map(lambda digit: f'{digit:0X}', self.checksum))
+        return self.checksum.hex().upper()
 
-    def __getattr__(self, __name: str):
-        return getattr(self.data, __name)
-
-    def __str__(self):
+    def __repr__(self):
         s = f'<{self.message_type.name}'
         s += f' counter: {self.counter},'
         s += f' checksum: {self._checksum_str()}>'
-        s += f'\ndata:\n{self.data}\nend data'
         return s
 
+    def to_debug_string(self) -> str:
+        """
+        Describes the message including all of its protobuf data, which is comparatively slow to format
+        """
+        return f'{self!r}\ndata:\n{self.data}\nend data'
+
     def to_dict(self):
-        return MessageToDict(self, preserving_proto_field_name=True)
+        return MessageToDict(self.data, preserving_proto_field_name=True)
+
+
+# (message type, decoder) indexed by raw message type value, or None where there is no decoder
+_DECODER_TABLE = [
+    (MessageType(value), Message.MESSAGE_TYPE_DECODERS[value]) if value in Message.MESSAGE_TYPE_DECODERS else None
+    for value in range(max(MessageType) + 1)
+]
 
 
 class DecodeError(Exception):
@@ -157,55 +203,93 @@ class DecodeError(Exception):
 class ArcticSpaProtocol:
     """
     Network protocol decoder
+
+    With `reuse_data` enabled, a single protobuf instance is kept per message type and
+        overwritten by each decoded message of that type. This avoids an allocation per message,
+        but `message.data` is then only valid until the next message of the same type is decoded
     """
 
-    HEADER_SIZE = 20
-    PREAMBLE = b'\xab\xad\x1d\x3a'
+    HEADER_SIZE = HEADER_SIZE
+    PREAMBLE = PREAMBLE
+
+    def __init__(self, reuse_data: bool = False):
+        self._data_pool = {} if reuse_data else None
 
-    def decode(self, data: bytes) -> list[Message]:
+    def decode(self, data: bytes | bytearray | memoryview) -> list[Message]:
         """
         Decodes the raw data into a list of messages
+
+        Accepts any bytes-like object; headers are read in place and each message keeps its own copy of its payload
         """
         messages = []
 
-        to_decode = data
+        view = memoryview(data)
+        offset = 0
 
-        while len(to_decode) > 0:
-            message, remainder = self.decode_one(to_decode)
+        while offset < len(view):
+            message, offset = self.decode_one(view, offset)
             messages.append(message)
 
-            to_decode = remainder
-
         return messages
 
-    def decode_one(self, data: bytes) -> tuple[Message, bytes]:
+    def decode_header(self, data: bytes | bytearray | memoryview, offset: int = 0) -> tuple:
         """
-        Decodes the first message of the data and return any undecoded data
+        Validates and unpacks the header of the message starting at `offset`
         """
-        if len(data) < ArcticSpaProtocol.HEADER_SIZE:
-            raise DecodeError(f'Expecting at least {ArcticSpaProtocol.HEADER_SIZE} bytes, got {len(data)}')
+        available = len(data) - offset
+
+        if available < HEADER_SIZE:
+            raise DecodeError(f'Expecting at least {HEADER_SIZE} bytes, got {available}')
+
+        header = _HEADER_STRUCT.unpack_from(data, offset)
 
-        if data[0:4] != ArcticSpaProtocol.PREAMBLE:
+        if header[0] != _PREAMBLE_INT:
             raise DecodeError('Data does not start with correct preamble')
 
-        header = struct.unpack('!xxxxBBBBIIHH', data[0:ArcticSpaProtocol.HEADER_SIZE])
+        return header
+
+    def payload_length(self, header: bytes | bytearray | memoryview) -> int:
+        """
+        Validates a message header and returns the length of the payload that follows it
+        """
+        return self.decode_header(header)[5]
+
+    def decode_one(self, data: bytes | bytearray | memoryview, offset: int = 0) -> tuple[Message, int]:
+        """
+        Decodes the message starting at `offset` and returns it with the offset of any undecoded data
+        """
+        header = self.decode_header(data, offset)
+
+        payload_start = offset + HEADER_SIZE
+        payload_end = payload_start + header[5]
+
+        message = self.decode_payload(header, memoryview(data)[payload_start:payload_end])
 
-        message_type = MessageType(header[6])
-        length = header[7]
-        payload = data[ArcticSpaProtocol.HEADER_SIZE : (ArcticSpaProtocol.HEADER_SIZE + length)]
+        return message, payload_end
+
+    def decode_payload(self, header: tuple, payload: bytes | bytearray | memoryview) -> Message | None:
+        """
+        Decodes the payload that follows a header already unpacked by `.decode_header()`
+
+        Returns `None` for heartbeats and message types without a protobuf decoder
+        """
+        _, checksum, counter, _, raw_message_type, _ = header
 
-        message = None
+        entry = _DECODER_TABLE[raw_message_type] if raw_message_type < len(_DECODER_TABLE) else None
 
-        if message_type != MessageType.HEARTBEAT:
-            checksum = bytes(header[0:4])
-            counter = header[4]
+        if entry is None:
+            # Heartbeats, unknown and undecodable message types are all skipped
+            return None
 
-            if message_type in Message.MESSAGE_TYPE_DECODERS:
-                message = Message(message_type, counter, checksum, payload)
+        message_type, decoder = entry
 
-        remainder = data[ArcticSpaProtocol.HEADER_SIZE + length :]
+        pooled_data = None
+        if self._data_pool is not None:
+            pooled_data = self._data_pool.get(raw_message_type)
+            if pooled_data is None:
+                pooled_data = self._data_pool[raw_message_type] = decoder()
 
-        return message, remainder
+        return Message.from_payload(message_type, counter, checksum, payload, decoder, pooled_data)
 
 
 class CommandType(StrEnum):
@@ -251,6 +335,35 @@ class SaunaState(IntEnum):
 MIN_TEMPERATURE = 59
 MAX_TEMPERATURE = 104
 
+SOCKET_BUFFER_SIZE = 1 << 20
+READ_BUFFER_SIZE = 1 << 16
+
+_COMMAND_TYPE_VALUE_CLASS = {
+    CommandType.TEMPERATURE_SETPOINT_FAHRENHEIT: int,
+    CommandType.PUMP_1: PumpStatus,
+    CommandType.PUMP_2: PumpStatus,
+    CommandType.PUMP_3: PumpStatus,
+    CommandType.PUMP_4: PumpStatus,
+    CommandType.PUMP_5: PumpStatus,
+    CommandType.BLOWER_1: PumpStatus,
+    CommandType.BLOWER_2: PumpStatus,
+    CommandType.LIGHTS: bool,
+    CommandType.STEREO: bool,
+    CommandType.FILTER: bool,
+    CommandType.ONZEN: bool,
+    CommandType.OZONE: bool,
+    CommandType.EXHAUST_FAN: bool,
+    CommandType.SAUNA_STATE: SaunaState,
+    CommandType.SAUNA_TIME_LEFT: int,
+    CommandType.ALL_ON: bool,
+    CommandType.FOGGER: bool,
+    CommandType.SPABOY_BOOST: bool,
+    CommandType.PACK_RESET: bool,
+    CommandType.LOG_DUMP: bool,
+    CommandType.SDS: bool,
+    CommandType.YESS: bool
+}
+
 
 def assert_connected(func):
     def wrapper(self, *args, **kwargs):
@@ -265,7 +378,12 @@ class ArcticSpaClient:
     Interface for communicating with Arctic Spa hot tubs
     """
 
-    def __init__(self, host: str = None, port: int = None):
+    # Request packets only depend on the message type, so all of them are serialized up front
+    _REQUEST_PACKET_CACHE: dict[MessageType, bytes] = {
+        message_type: Packet(message_type.value, bytearray()).serialize() for message_type in MessageType
+    }
+
+    def __init__(self, host: str = None, port: int = None, reuse_message_data: bool = False):
         """
         Configures a new client
 
@@ -276,14 +394,21 @@ class ArcticSpaClient:
             * Calling `.poll_messages()` to receive multiple requested messages
             * Calling `.fetch_one()` to receive a single requested message
             * Calling `.write_requested_messages()` and then reading
-                back with `.read_messages()` or `.read_raw_stream_data()`
+                back with `.read_message()`, `.read_messages()` or `.read_raw_stream_data()`
+
+        Set `reuse_message_data` to recycle one protobuf object per message type between reads;
+            see `ArcticSpaProtocol` for the lifetime this implies for `message.data`
         """
         self.host = host
         self.port = port or 65534
 
-        self._proto = ArcticSpaProtocol()
+        self._proto = ArcticSpaProtocol(reuse_message_data)
         self._conn = None
 
+        self._read_buffer = bytearray(READ_BUFFER_SIZE)
+        self._read_view = memoryview(self._read_buffer)
+        self._header_view = memoryview(bytearray(HEADER_SIZE))
+
     def __enter__(self):
         self.connect()
         return self
@@ -291,13 +416,6 @@ class ArcticSpaClient:
     def __exit__(self, exc_type, exc, tb):
         self.disconnect()
 
-    def __del__(self):
-        """
-        Attempt to close connection if not already closed
-        """
-        if self.is_connected():
-            self._conn.close()
-
     def connect(
         self,
         host: str | None = None,
@@ -307,6 +425,9 @@ class ArcticSpaClient:
     ) -> bool:
         """
         Opens a connection to the host device
+
+        Connection attempts that time out are retried up to `attempts` times in total,
+            waiting 2, 4, then at most 8 seconds between attempts
         """
         self.disconnect()
 
@@ -326,27 +447,46 @@ class ArcticSpaClient:
                 break
             except socket.timeout:
                 attempt += 1
+                if attempt < attempts:
+                    # Back off exponentially so a rebooting device is not hammered with connections
+                    time.sleep(min(2 ** attempt, 8))
             except (OSError, ConnectionRefusedError):
                 return False
 
         connected = self.is_connected()
 
         if connected:
+            self._configure_socket()
             self.host = host
             self.port = port
 
         return connected
 
+    def _configure_socket(self) -> None:
+        """
+        Tunes the open connection for small request packets answered by bursts of messages,
+            and for long-lived polling sessions
+        """
+        self._conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        self._conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+
     def disconnect(self) -> None:
         """
         Closes the connection to the host device
         """
         if self._conn:
             try:
-                self._conn.shutdown(2)
-                self._conn.close()
+                if self._conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                    # Already broken; reset on close instead of attempting a graceful shutdown
+                    self._conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                else:
+                    self._conn.shutdown(socket.SHUT_RDWR)
             except Exception:
                 pass
+            finally:
+                self._conn.close()
 
             self._conn = None
 
@@ -359,12 +499,9 @@ class ArcticSpaClient:
     @staticmethod
     def _get_message_type_packet_bytes(message_type: MessageType) -> bytes:
         """
-        Crafts a command packet in bytes based on the numeric message type
+        Returns the precomputed command packet in bytes for the numeric message type
         """
-        packet_type = message_type.value
-        packet = Packet(packet_type, bytearray())
-        packet_bytes = packet.serialize()
-        return packet_bytes
+        return ArcticSpaClient._REQUEST_PACKET_CACHE[message_type]
 
     @assert_connected
     def write_requested_messages(
@@ -380,18 +517,35 @@ class ArcticSpaClient:
         elif isinstance(message_types, (list, tuple)):
             message_types = set(message_types)
 
-        command_packet_bytes = b''
-        for message_type in message_types:
-            command_packet_bytes += self._get_message_type_packet_bytes(message_type)
+        command_packets = [
+            self._get_message_type_packet_bytes(message_type) for message_type in message_types
+        ]
 
-        self._conn.sendall(command_packet_bytes)
+        self._send_packets(command_packets)
+
+    def _send_packets(self, packets: list[bytes]) -> None:
+        """
+        Writes the packets over the open connection, in a single scatter/gather call where supported
+        """
+        if not hasattr(self._conn, 'sendmsg'):
+            self._conn.sendall(b''.join(packets))
+            return
+
+        sent = self._conn.sendmsg(packets)
+        if sent < sum(map(len, packets)):
+            # Partial write; send whatever is left the usual way
+            self._conn.sendall(b''.join(packets)[sent:])
 
     @assert_connected
-    def read_raw_stream_data(self) -> bytes:
+    def read_raw_stream_data(self) -> memoryview:
         """
         Reads data sent over the network from the host device
+
+        The data is received into a buffer that is reused by every call, so the returned view
+            is only valid until the next read; copy it with `bytes()` to keep it
         """
-        return self._conn.recv(2048)
+        count = self._conn.recv_into(self._read_buffer)
+        return self._read_view[:count]
 
     @assert_connected
     def read_messages(self) -> list[Message]:
@@ -401,6 +555,56 @@ class ArcticSpaClient:
         data = self.read_raw_stream_data()
         return self._proto.decode(data)
 
+    def _read_exactly(self, view: memoryview, deadline: float | None = None, frame_started: bool = False) -> memoryview:
+        """
+        Fills `view` with data from the host device, waiting for the rest if the data arrives in pieces
+
+        With a `deadline`, each read only waits for the time remaining until it
+        A timeout part way through a frame leaves the rest of it unread, so the connection is closed
+            rather than left out of step with the stream
+        """
+        size = len(view)
+        received = 0
+        while received < size:
+            try:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError
+                    self._conn.settimeout(remaining)
+                count = self._conn.recv_into(view[received:])
+            except TimeoutError:
+                if frame_started or received:
+                    self.disconnect()
+                    raise TimeoutError('Timeout part way through a message; connection closed') from None
+                raise TimeoutError('Timeout waiting for messages') from None
+            if not count:
+                self.disconnect()
+                raise ConnectionError('Connection closed by host device')
+            received += count
+        return view
+
+    def _read_message(self, deadline: float | None = None) -> Message | None:
+        try:
+            header = self._proto.decode_header(self._read_exactly(self._header_view, deadline))
+        except DecodeError:
+            # There is no way to tell where the next frame starts, so the stream cannot be read in step
+            self.disconnect()
+            raise
+        # Payload lengths are 16 bit, so always fit the read buffer; the message copies what it keeps
+        payload = self._read_exactly(self._read_view[:header[5]], deadline, frame_started=True)
+        return self._proto.decode_payload(header, payload)
+
+    @assert_connected
+    def read_message(self) -> Message | None:
+        """
+        Reads exactly one message frame from the host device and returns the parsed protobuf message
+
+        Returns `None` for heartbeats and message types without a protobuf decoder
+        A frame that cannot be decoded closes the connection, since the stream is then out of step
+        """
+        return self._read_message()
+
     def _poll_messages(
         self,
         message_types: list[MessageType] | tuple[MessageType] | set[MessageType],
@@ -408,19 +612,22 @@ class ArcticSpaClient:
     ) -> dict:
         """
         Polls the host device until all requested message data has been recieved
+
+        The timeout covers the whole poll; every socket read waits only for the time left of it
         """
-        start = time.time()
-        requested_messages = {
-            message_type: None for message_type in message_types
-        }
-        missing_messages = True
-        while missing_messages:
-            if timeout and (time.time() - start) > timeout:
-                raise TimeoutError('Timeout waiting for messages')
-            for message in self.read_messages():
+        deadline = time.monotonic() + timeout if timeout else None
+        socket_timeout = self._conn.gettimeout()
+        requested_messages = {}
+        missing_message_types = set(message_types)
+        try:
+            while missing_message_types:
+                message = self._read_message(deadline)
                 if message:
                     requested_messages[message.message_type] = message
-            missing_messages = None in requested_messages.values()
+                    missing_message_types.discard(message.message_type)
+        finally:
+            if self._conn:
+                self._conn.settimeout(socket_timeout)
         return requested_messages
 
     @assert_connected
@@ -465,33 +672,7 @@ class ArcticSpaClient:
         """
         Validates the requested value based on the command type being set
         """
-        command_type_value_class = {
-            CommandType.TEMPERATURE_SETPOINT_FAHRENHEIT: int,
-            CommandType.PUMP_1: PumpStatus,
-            CommandType.PUMP_2: PumpStatus,
-            CommandType.PUMP_3: PumpStatus,
-            CommandType.PUMP_4: PumpStatus,
-            CommandType.PUMP_5: PumpStatus,
-            CommandType.BLOWER_1: PumpStatus,
-            CommandType.BLOWER_2: PumpStatus,
-            CommandType.LIGHTS: bool,
-            CommandType.STEREO: bool,
-            CommandType.FILTER: bool,
-            CommandType.ONZEN: bool,
-            CommandType.OZONE: bool,
-            CommandType.EXHAUST_FAN: bool,
-            CommandType.SAUNA_STATE: SaunaState,
-            CommandType.SAUNA_TIME_LEFT: int,
-            CommandType.ALL_ON: bool,
-            CommandType.FOGGER: bool,
-            CommandType.SPABOY_BOOST: bool,
-            CommandType.PACK_RESET: bool,
-            CommandType.LOG_DUMP: bool,
-            CommandType.SDS: bool,
-            CommandType.YESS: bool
-        }
-
-        value_class = command_type_value_class.get(command_type)
+        value_class = _COMMAND_TYPE_VALUE_CLASS.get(command_type)
 
         if not value_class:
             raise ValueError(f'Invalid command type "{command_type}"')
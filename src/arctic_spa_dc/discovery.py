@@ -9,12 +9,14 @@ searcher = NetworkSearch('192.168.100.5', 24)
 results = searcher.search()
 ```
 
+From a running event loop, use `await searcher.search_async()` instead
+
 """
 
 
+import asyncio
 import socket
 import ipaddress
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def udp_probe(
@@ -48,6 +50,66 @@ def udp_probe(
     return False
 
 
+class _UdpScanProtocol(asyncio.DatagramProtocol):
+    """
+    Collects the hosts that reply with the expected response, resolving `finished` once all have
+    """
+
+    def __init__(self, hosts: list, response: bytes, finished: asyncio.Future) -> None:
+        self._pending = set(hosts)
+        self._response = response
+        self._finished = finished
+        self.found = []
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        host = addr[0]
+        if host in self._pending and data.startswith(self._response):
+            self._pending.discard(host)
+            self.found.append(host)
+            if not self._pending and not self._finished.done():
+                self._finished.set_result(None)
+
+    def error_received(self, exc: OSError) -> None:
+        pass  # An unreachable host should not end the scan for the others
+
+
+async def udp_scan_async(
+    hosts: list,
+    query: bytes,
+    query_port: int,
+    response: bytes,
+    timeout: float = 1.0,
+    broadcast_address: str | None = None
+) -> list:
+    """
+    Sends a UDP query to every host from a single socket, then collects responses until the timeout.
+    Returns the hosts that sent the expected response, in the order they replied.
+
+    If `broadcast_address` is given, one broadcast query is sent there instead of one query per host;
+    replies are still only accepted from `hosts`.
+    """
+    loop = asyncio.get_running_loop()
+    finished = loop.create_future()
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: _UdpScanProtocol(hosts, response, finished),
+        local_addr=('0.0.0.0', 0),  # Bind to an ephemeral port to avoid conflicts
+        allow_broadcast=broadcast_address is not None
+    )
+    try:
+        if broadcast_address is not None:
+            transport.sendto(query, (broadcast_address, query_port))
+        else:
+            for host in hosts:
+                transport.sendto(query, (host, query_port))
+        try:
+            await asyncio.wait_for(finished, timeout)
+        except TimeoutError:
+            pass
+    finally:
+        transport.close()
+    return protocol.found
+
+
 class NetworkSearch:
     """
     Searches the network for an Arctic Spa device
@@ -70,27 +132,36 @@ class NetworkSearch:
         self._ip_address = ip_address
         self._network = ipaddress.ip_network(f'{ip_address}/{netmask}', strict=False)
 
-    def search(self, timeout: float = 1.0, max_workers: int = 50) -> list:
+    def search(self, timeout: float = 1.0, max_workers: int | None = None) -> list:
         """
-        Searches the network for any Arctic Spa devices and returns a list of IP addresses, using threads for speed.
+        Searches the network for any Arctic Spa devices and returns a list of IP addresses.
+        Runs `search_async()` in a new event loop, so it cannot be called from a running one.
+
+        `max_workers` is deprecated and ignored; all hosts are queried from a single socket.
         """
-        hosts = [str(host) for host in self._network.hosts()]
-        found = []
+        return asyncio.run(self.search_async(timeout))
 
-        def probe(host_str):
-            got_valid_response = udp_probe(
-                host_str,
+    async def search_async(self, timeout: float = 1.0) -> list:
+        """
+        Searches the network for any Arctic Spa devices and returns a list of IP addresses.
+        A single broadcast query is tried first; if nothing answers, every host is queried directly
+        since some devices ignore broadcasts.
+        """
+        hosts = [str(host) for host in self._network.hosts()]
+        found = await udp_scan_async(
+            hosts,
+            self.QUERY,
+            self.QUERY_PORT,
+            self.RESPONSE,
+            timeout,
+            broadcast_address=str(self._network.broadcast_address)
+        )
+        if not found:
+            found = await udp_scan_async(
+                hosts,
                 self.QUERY,
                 self.QUERY_PORT,
                 self.RESPONSE,
                 timeout
             )
-            return host_str if got_valid_response else None
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(probe, host): host for host in hosts}
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    found.append(result)
         return found
@@ -1,5 +1,10 @@
+import struct
 import zlib
-from arctic_spa_dc.bytebuffer import ByteBuffer
+
+
+# magic, checksum placeholder, sequence number, optional, type, size
+_HEADER_STRUCT = struct.Struct('!iIIIHH')
+_CHECKSUM_STRUCT = struct.Struct('!I')
 
 
 class Packet:
@@ -20,19 +25,23 @@ class Packet:
 
     def checksum_valid(self):
         # Allocate buffer with size payload length + 20 (matching C# logic)
-        buffer = ByteBuffer.allocate(len(self.payload) + 20)
+        buffer = bytearray(_HEADER_STRUCT.size + len(self.payload))
 
         # Populate buffer with packet details
-        buffer.put_int(-1414717974)  # Equivalent to the magic number in C#
-        buffer.put_int(0)  # Padding or optional field
-        buffer.put_int(self.sequence_number)
-        buffer.put_int(self.optional)
-        buffer.put_short(self.type)
-        buffer.put_short(self.size)
-        buffer.put_bytes(self.payload)
+        _HEADER_STRUCT.pack_into(
+            buffer,
+            0,
+            -1414717974,  # Equivalent to the magic number in C#
+            0,  # Padding or optional field
+            self.sequence_number,
+            self.optional,
+            self.type,
+            self.size
+        )
+        buffer[_HEADER_STRUCT.size:] = self.payload
 
-        # Calculate CRC32 checksum using zlib
-        crc32 = zlib.crc32(buffer.get_stream().getvalue())
+        # Calculate CRC32 checksum using zlib, directly over the buffer
+        crc32 = zlib.crc32(buffer)
 
         # Validate the checksum: If CRC32 result is within bounds, return True
         if (-1 & crc32) == crc32:
@@ -41,23 +50,27 @@ class Packet:
 
     def serialize(self):
         # Allocate buffer with size payload length + 20 (matching C# logic)
-        buffer = ByteBuffer.allocate(self.size + 20)
+        buffer = bytearray(_HEADER_STRUCT.size + len(self.payload))
 
         # Populate buffer with packet details
-        buffer.put_int(-1414718150)  # Equivalent to the magic number in C#
-        buffer.put_int(0)  # Padding or optional field
-        buffer.put_int(self.sequence_number)
-        buffer.put_int(self.optional)
-        buffer.put_short(self.type)
-        buffer.put_short(self.size)
-        buffer.put_bytes(self.payload)
-
-        # Calculate and update CRC32 checksum
-        crc32 = zlib.crc32(buffer.get_stream().getvalue())
+        _HEADER_STRUCT.pack_into(
+            buffer,
+            0,
+            -1414718150,  # Equivalent to the magic number in C#
+            0,  # Padding or optional field
+            self.sequence_number,
+            self.optional,
+            self.type,
+            self.size
+        )
+        buffer[_HEADER_STRUCT.size:] = self.payload
+
+        # Calculate and update CRC32 checksum, directly over the buffer
+        crc32 = zlib.crc32(buffer)
         self.checksum = crc32  # Save checksum as an int
 
-        # Update buffer with checksum at the right position (putting it back into the byte array)
-        buffer.put_int_at(4, self.checksum)
+        # Update buffer with checksum at the right position
+        _CHECKSUM_STRUCT.pack_into(buffer, 4, self.checksum)
 
         # Return the serialized packet as bytes
-        return buffer.get_stream().getvalue()
+        return bytes(buffer)
@@ -0,0 +1,85 @@
+import socket
+import unittest
+
+from arctic_spa_dc.client import ArcticSpaClient
+from arctic_spa_dc.client import DecodeError
+from arctic_spa_dc.client import MessageType
+from arctic_spa_dc.packet import Packet
+from arctic_spa_dc.proto import Live_pb2
+
+
+def live_frame(temperature_fahrenheit: int) -> bytes:
+    live = Live_pb2.Live()
+    live.temperature_fahrenheit = temperature_fahrenheit
+    return Packet(MessageType.LIVE.value, live.SerializeToString()).serialize()
+
+
+class ReadMessageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ArcticSpaClient('127.0.0.1')
+        self.host_ends = []
+
+    def tearDown(self):
+        self.client.disconnect()
+        for host_end in self.host_ends:
+            host_end.close()
+
+    def attach(self) -> socket.socket:
+        """
+        Connects the client to one end of a socket pair and returns the end playing the host device
+        """
+        client_end, host_end = socket.socketpair()
+        client_end.settimeout(1.0)
+        self.client._conn = client_end
+        self.host_ends.append(host_end)
+        return host_end
+
+    def test_reads_frame(self):
+        self.attach().sendall(live_frame(100))
+
+        message = self.client.read_message()
+
+        self.assertEqual(message.message_type, MessageType.LIVE)
+        self.assertEqual(message.data.temperature_fahrenheit, 100)
+
+    def test_messages_keep_their_payload(self):
+        self.attach().sendall(live_frame(100) + live_frame(101))
+
+        first = self.client.read_message()
+        second = self.client.read_message()
+
+        self.assertEqual(first.payload, live_frame(100)[self.client._proto.HEADER_SIZE:])
+        self.assertEqual(first.data.temperature_fahrenheit, 100)
+        self.assertEqual(second.data.temperature_fahrenheit, 101)
+
+    def test_stray_byte_closes_connection(self):
+        self.attach().sendall(b'\x00' + live_frame(100))
+
+        with self.assertRaises(DecodeError):
+            self.client.read_message()
+
+        self.assertFalse(self.client.is_connected())
+
+        self.attach().sendall(live_frame(101))
+
+        message = self.client.read_message()
+
+        self.assertEqual(message.data.temperature_fahrenheit, 101)
+
+    def test_host_close_disconnects(self):
+        host_end = self.attach()
+        host_end.sendall(live_frame(100)[:10])
+        host_end.close()
+
+        with self.assertRaises(ConnectionError):
+            self.client.read_message()
+
+        self.assertFalse(self.client.is_connected())
+
+        with self.assertRaises(ConnectionError):
+            self.client.read_message()
+
+
+if __name__ == '__main__':
+    unittest.main()